@@ -8,13 +8,22 @@ python add_weight.py --file <filename> <date> <weight>
 import csv
 from datetime import datetime
 import argparse
+import re
 
 DATA_DIR = "data"
 DATA_FILENAME = "weight.csv"
 
+# Year, month and day are read by position (match[1], match[2], match[3]). Keep it that way:
+# named groups with groupdict() and **kwargs build a dict per call for no benefit.
+_DATE_RE = re.compile(r'(\d{4})-(\d{2})-(\d{2})', re.ASCII)
+
 def validate_date(date_str):
+    # Fixed YYYY-MM-DD format: match the precompiled pattern instead of going through strptime
+    match = _DATE_RE.fullmatch(date_str)
     try:
-        datetime.strptime(date_str, '%Y-%m-%d')
+        if not match:
+            raise ValueError
+        datetime(int(match[1]), int(match[2]), int(match[3]))
         return True
     except ValueError:
         print("Invalid date format. Please try again.")
@@ -27,10 +36,11 @@ def get_valid_date(prompt="Enter date (YYYY-MM-DD): "):
             return date_str
 
 def validate_weight(weight_str):
-    if weight_str.isdigit():
-        weight = int(weight_str)
-        if weight > 0:
+    try:
+        if int(weight_str) > 0:
             return True
+    except ValueError:
+        pass
     print("Weight must be a positive integer.")
     return False
 
@@ -38,7 +48,13 @@ def get_valid_weight(prompt="Enter weight in grams: "):
     while True:
         weight_str = input(prompt)
         if validate_weight(weight_str):
-            return weight_str
+            return str(int(weight_str))  # normalize e.g. " 12", "+12" or "1_000" before writing
+
+def append_rows(rows, file_path):
+    # Write all rows under a single open() with a large buffer, so that bulk appends
+    # cost one flush instead of one open/write/close per row
+    with open(file_path, 'a', newline='', buffering=1 << 20) as csvfile:
+        csv.writer(csvfile).writerows(rows)
 
 def main() -> None:
     """
@@ -60,21 +76,19 @@ def main() -> None:
     else:
         date = get_valid_date()
 
-    if args.weight:
-        weight_str = str(args.weight)
-        if validate_weight(weight_str):
-            weight = weight_str
+    if args.weight is not None:
+        # args.weight is already parsed as float, so check it directly instead of re-parsing its string form
+        if args.weight > 0 and args.weight.is_integer():
+            weight = str(int(args.weight))
         else:
-            print(f"Invalid weight: {args.weight}. Weight must be a positive number. Falling back to interactive mode.")
+            print(f"Invalid weight: {args.weight}. Weight must be a positive integer. Falling back to interactive mode.")
             weight = get_valid_weight()
     else:
         weight = get_valid_weight()
 
     file_path = f"{DATA_DIR}/{args.file}"
 
-    with open(file_path, 'a', newline='') as csvfile:
-        writer = csv.writer(csvfile)
-        writer.writerow([date, weight])
+    append_rows([(date, weight)], file_path)
 
     print(f"Added {date}, {weight} kg to {file_path}")
 
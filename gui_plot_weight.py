@@ -12,13 +12,32 @@ Features:
 import tkinter as tk
 from tkinter import filedialog, messagebox
 from datetime import datetime
-import matplotlib
-matplotlib.use("TkAgg") # Set backend before importing pyplot
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+import os
+import queue
+import threading
 
-# Import core functions from the existing script
-from plot_weight import load_data, load_fenton_data, plot_data  # plot_data now returns a Figure
+# Matplotlib and the core functions of the existing script are imported on the first
+# plot (see _import_plotting), so that the window appears without waiting for them
+plt = None
+Figure = None
+FigureCanvasTkAgg = None
+load_data = load_fenton_data = plot_data = compute_limits = None
+_plot_imports_done = False
+
+
+def _import_plotting():
+    global plt, Figure, FigureCanvasTkAgg, load_data, load_fenton_data, plot_data, compute_limits, _plot_imports_done
+    if _plot_imports_done:
+        return
+    import matplotlib
+    matplotlib.use("TkAgg") # Set backend before importing pyplot
+    import matplotlib.pyplot as plt
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+    # Import core functions from the existing script
+    from plot_weight import load_data, load_fenton_data, plot_data, compute_limits  # plot_data now returns a Figure
+    _plot_imports_done = True
 
 
 class WeightPlotApp(tk.Tk):
@@ -33,7 +52,14 @@ class WeightPlotApp(tk.Tk):
         self.grid_columnconfigure(0, weight=1)
         
         self._create_widgets()
-        self.canvas = None  # Will hold the FigureCanvasTkAgg instance
+        self.canvas = None  # Will hold the FigureCanvasTkAgg instance, created once on the first plot
+        self._ax = None  # Axes of the canvas' figure, cleared and reused for every plot
+        self._baby_line = None  # Line2D of the baby's measurements, drawn on top of a cached background
+        self._background = None  # Rendered figure without the baby's measurements
+        self._plot_key = None  # (due date, axis limits) the background was rendered for
+        self._loading = False  # True while a worker thread is loading data for a plot
+        self._load_generation = 0  # Bumped by Clear, so that results of loads started before are dropped
+        self._tight_bbox = None  # Padded tight bounding box (inches) of the current plot, computed on first save
 
     def _create_widgets(self):
         # Control panel at row 0
@@ -70,6 +96,11 @@ class WeightPlotApp(tk.Tk):
         # Clear button
         tk.Button(button_frame, text="Clear", command=self._clear_form).grid(row=0, column=2, padx=5, pady=2)
         
+        # High-DPI toggle for raster exports (PNG/JPEG are saved at screen resolution otherwise)
+        self.high_dpi_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(button_frame, text="High-DPI export (300 DPI)", variable=self.high_dpi_var).grid(
+            row=0, column=3, padx=5, pady=2)
+        
         # Plot display area at row 1 (expands to fill available space)
         self.plot_frame = tk.Frame(self)
         self.plot_frame.grid(row=1, column=0, sticky="nsew", padx=10, pady=(0, 10))
@@ -93,16 +124,35 @@ class WeightPlotApp(tk.Tk):
         if file_path:
             self.file_path_var.set(file_path)
 
+    def _ensure_canvas(self):
+        # Create the figure and canvas once and reuse them, instead of rebuilding the Tk widget on every plot
+        if self.canvas:
+            return
+        fig = Figure(figsize=(10, 5))
+        self._ax = fig.add_subplot()
+        self.canvas = FigureCanvasTkAgg(fig, master=self.plot_frame)
+        self.canvas.mpl_connect('draw_event', self._on_draw)
+        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+
+    def _reset_plot_state(self):
+        self._baby_line = None
+        self._background = None
+        self._plot_key = None
+        self._tight_bbox = None
+
     def _clear_canvas(self):
+        self._reset_plot_state()
         if self.canvas:
-            self.canvas.get_tk_widget().destroy()
-            self.canvas = None
+            self._ax.cla()
+            self._ax.set_visible(False)
+            self.canvas.draw_idle()
         self.status_var.set("Plot cleared")
         self.update_idletasks()  # Force layout update
 
     def _clear_form(self):
         self.file_path_var.set("")
         self.due_date_var.set("")
+        self._load_generation += 1
         self._clear_canvas()
         self.status_var.set("Form cleared")
         self.update_idletasks()  # Force layout update
@@ -124,56 +174,154 @@ class WeightPlotApp(tk.Tk):
             messagebox.showerror("Error", "Due date must be in YYYY-MM-DD format.")
             return
 
-        # Load baby data
+        if self._loading:
+            self.status_var.set("Still loading, please wait...")
+            return
+
+        _import_plotting()
+
+        # Load the data in a worker thread so that the window stays responsive for large files.
+        # Tkinter and Matplotlib are not thread-safe, so the plot is drawn back in the main thread.
+        self._loading = True
+        self.status_var.set("Loading data...")
+        results = queue.Queue()
+        threading.Thread(target=self._load_worker, args=(file_path, due_date, self._plot_key, results),
+                         daemon=True).start()
+        self.after(50, self._poll_load, due_date, self._load_generation, results)
+
+    def _load_worker(self, file_path, due_date, current_plot_key, results):
+        # Runs in the worker thread. Always put a result on the queue, even on unexpected errors,
+        # otherwise _poll_load would wait forever.
+        try:
+            result = self._load_plot_data(file_path, due_date, current_plot_key)
+        except Exception as e:
+            result = ((messagebox.showerror, "Error", f"Failed to prepare plot data:\n{e}"), None)
+        results.put(result)
+
+    def _load_plot_data(self, file_path, due_date, current_plot_key):
+        # Load data only, and report errors as (function, title, message)
         try:
             baby_dates, baby_weights = load_data(file_path)
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to load weight data:\n{e}")
+            return (messagebox.showerror, "Error", f"Failed to load weight data:\n{e}"), None
+
+        if baby_dates.size == 0:
+            return (messagebox.showwarning, "No Data", "No valid weight entries found."), None
+
+        # If the due date and axis limits are unchanged, the Fenton curves and axes are too,
+        # so they don't need to be loaded again
+        plot_key = (due_date, compute_limits(baby_dates, margin_percent=0.05),
+                    compute_limits(baby_weights, margin_percent=0.10))
+        fenton_data = None
+        if plot_key != current_plot_key:
+            try:
+                fenton_data = load_fenton_data(due_date)
+            except Exception as e:
+                return (messagebox.showerror, "Error", f"Failed to load Fenton data:\n{e}"), None
+
+        return None, (baby_dates, baby_weights, plot_key, fenton_data)
+
+    def _poll_load(self, due_date, generation, results):
+        try:
+            error, data = results.get_nowait()
+        except queue.Empty:
+            self.after(50, self._poll_load, due_date, generation, results)
             return
 
-        if not baby_dates:
-            messagebox.showwarning("No Data", "No valid weight entries found.")
+        self._loading = False
+        if generation != self._load_generation:
+            return  # The form was cleared while loading, drop the result
+        self.status_var.set("Ready")
+        if error:
+            show, title, message = error
+            show(title, message)
             return
+        self._show_plot(due_date, *data)
 
-        # Load Fenton growth curves
-        try:
-            fenton_data = load_fenton_data(due_date)
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to load Fenton data:\n{e}")
+    def _show_plot(self, due_date, baby_dates, baby_weights, plot_key, fenton_data):
+        # Only redraw the baby's measurements on top of the cached background if it still matches
+        if self._background is not None and plot_key == self._plot_key:
+            self.canvas.restore_region(self._background)
+            self._baby_line.set_data(baby_dates, baby_weights)
+            self._baby_line.axes.draw_artist(self._baby_line)
+            self.canvas.blit(self._baby_line.axes.bbox)
             return
 
-        # Generate figure
+        # The plot was cleared or changed while loading: load the Fenton growth curves after all
+        if fenton_data is None:
+            try:
+                fenton_data = load_fenton_data(due_date)
+            except Exception as e:
+                messagebox.showerror("Error", f"Failed to load Fenton data:\n{e}")
+                return
+
+        # Redraw the embedded figure
+        # Only reset the state here: clearing the canvas would render an empty figure before the new plot
+        self._ensure_canvas()
+        self._reset_plot_state()
+        self._ax.set_visible(True)  # Before plotting, tight_layout ignores invisible axes
         try:
-            fig = plot_data(baby_dates, baby_weights, fenton_data)
+            plot_data(baby_dates, baby_weights, fenton_data, ax=self._ax)
         except Exception as e:
+            self._ax.cla()
+            self._ax.set_visible(False)
+            self.canvas.draw_idle()
             messagebox.showerror("Error", f"Failed to generate plot:\n{e}")
             return
 
-        # Embed figure in Tkinter
-        self._clear_canvas()
-        self.canvas = FigureCanvasTkAgg(fig, master=self.plot_frame)
-        self.canvas.draw()
-        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        self._baby_line = self._ax.lines[0]  # plot_data draws the baby's measurements first
+        self._baby_line.set_animated(True)  # Excluded from full draws, see _on_draw
+        self._plot_key = plot_key
+        self.canvas.draw_idle()
+
+    def _on_draw(self, event):
+        # Runs after every full draw (including resizes): cache the background, then add the baby's measurements.
+        # Draws for savefig, where the line is temporarily not animated, are left alone.
+        if self._baby_line is None or not self._baby_line.get_animated():
+            return
+        self._tight_bbox = None  # The figure may have been resized
+        self._background = self.canvas.copy_from_bbox(self.canvas.figure.bbox)
+        self._baby_line.axes.draw_artist(self._baby_line)
 
     def destroy(self):
-        plt.close('all')  # Close all matplotlib figures
+        if _plot_imports_done:
+            plt.close('all')  # Close all matplotlib figures
         self.status_var.set("Shutting down...")
         super().destroy()
 
     def _save_plot(self):
-        if not self.canvas:
+        if self._baby_line is None:
             messagebox.showinfo("No Plot", "Please generate a plot first before saving.")
             return
             
         file_path = filedialog.asksaveasfilename(
             defaultextension=".png",
-            filetypes=[("PNG files", "*.png"), ("JPEG files", "*.jpg"), ("All files", "*.*")],
+            filetypes=[("PNG files", "*.png"), ("JPEG files", "*.jpg"), ("PDF files", "*.pdf"),
+                       ("SVG files", "*.svg"), ("All files", "*.*")],
             title="Save Plot As"
         )
         
         if file_path:
+            fig = self.canvas.figure
+            # Raster formats are saved at screen resolution unless high-DPI export is enabled (~9x the pixels).
+            # Vector formats are resolution independent and cheap to write either way.
+            dpi = 'figure'
+            is_vector = os.path.splitext(file_path)[1].lower() in ('.pdf', '.svg')
+            if self.high_dpi_var.get() and not is_vector:
+                dpi = 300
+                self.status_var.set("Rendering plot at 300 DPI, this may take a moment...")
+                self.update_idletasks()
             try:
-                self.canvas.figure.savefig(file_path, dpi=300, bbox_inches='tight')
+                # Animated artists are skipped by savefig, so include the baby's measurements explicitly
+                self._baby_line.set_animated(False)
+                try:
+                    # Compute the tight bounding box once per plot instead of on every save
+                    if self._tight_bbox is None:
+                        self._tight_bbox = fig.get_tightbbox(self.canvas.get_renderer()).padded(
+                            plt.rcParams['savefig.pad_inches'])
+                    fig.savefig(file_path, dpi=dpi, bbox_inches=self._tight_bbox)
+                finally:
+                    self._baby_line.set_animated(True)
                 self.status_var.set(f"Plot saved to {file_path}")
                 messagebox.showinfo("Success", f"Plot saved successfully to {file_path}")
             except Exception as e:
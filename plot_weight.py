@@ -8,27 +8,74 @@ python plot_weight.py <filename> --due-date <YYYY-MM-DD>
 """
 
 import matplotlib
+import matplotlib.axes
+import matplotlib.figure
 import matplotlib.pyplot as plt
-import csv
+import numpy as np
 import argparse
-from datetime import datetime, timedelta
-from typing import List, Tuple, Dict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import List, Tuple, Dict, Optional
 import logging
 import os
+import tempfile
+import warnings
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
 DATA_DIRECTORY = 'data'
 FENTON_DIRECTORY = 'fenton_boys'
+FENTON_CACHE_FILE = f"{FENTON_DIRECTORY}/_cache.npz"
+PERCENTILES = ('3%', '10%', '50%', '90%', '97%')
+LINE_STYLES = {
+    '3%': ':',
+    '10%': '--',
+    '50%': '-',
+    '90%': '--',
+    '97%': ':'
+}
 DEFAULT_FILE_NAME = 'weight.csv'
 
-def load_data(file_name: str) -> Tuple[List[datetime], List[float]]:
+# Cache of already parsed date strings, shared across rows and calls to load_data
+_date_cache: Dict[str, datetime] = {}
+
+def parse_date(date_str: str) -> datetime:
     """
-    Load date and weight data from a CSV file.
+    Parse a date in the fixed ISO format YYYY-MM-DD.
+
+    Slicing out the fields and converting them with int() avoids the locale and
+    regex machinery of datetime.strptime, which dominates the cost of loading a CSV.
+    Anything other than zero-padded ASCII digits (e.g. '2024-1-5' in older logs) is
+    left to strptime, so the same dates are accepted as before. Results are memoized,
+    since the same dates recur when a file is reloaded.
 
     Parameters:
-    file_name (str): The name of the CSV file to load.
+    date_str (str): The date string to parse.
+
+    Returns:
+    datetime: The parsed date.
+
+    Raises:
+    ValueError: If the string is not a valid date in YYYY-MM-DD format.
+    """
+    date = _date_cache.get(date_str)
+    if date is None:
+        year, month, day = date_str[0:4], date_str[5:7], date_str[8:10]
+        if (len(date_str) == 10 and date_str[4] == '-' and date_str[7] == '-' and date_str.isascii()
+                and year.isdigit() and month.isdigit() and day.isdigit()):
+            date = datetime(int(year), int(month), int(day))
+        else:
+            date = datetime.strptime(date_str, '%Y-%m-%d')
+        _date_cache[date_str] = date
+    return date
+
+def _load_data_rows(file_path: str) -> Tuple[List[datetime], List[float]]:
+    """
+    Load date and weight data row by row, skipping (and logging) invalid rows.
+
+    Parameters:
+    file_path (str): The path of the CSV file to load.
 
     Returns:
     Tuple[List[datetime], List[float]]: Lists of dates and corresponding weights.
@@ -36,6 +83,40 @@ def load_data(file_name: str) -> Tuple[List[datetime], List[float]]:
     dates: List[datetime] = []
     weights: List[float] = []
 
+    # The files contain unquoted "date,weight" lines only, so plain str.split is enough
+    # and avoids the per-row overhead of csv.reader
+    with open(file_path, 'r') as f:
+        lines = f.read().splitlines()
+    for line in lines:
+        row = line.split(',')
+        if len(row) == 2:
+            date_str, weight_str = row
+            try:
+                date = parse_date(date_str)
+                weight = float(weight_str)
+                dates.append(date)
+                weights.append(weight)
+            except ValueError as e:
+                logging.warning(f"Skipping invalid row {row}: {e}")
+
+    return dates, weights
+
+def load_data(file_name: str) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Load date and weight data from a CSV file.
+
+    The file is parsed in one go with numpy.loadtxt. If it contains malformed rows or
+    dates not exactly in YYYY-MM-DD format, it is parsed again row by row, so that the
+    same rows are accepted either way.
+
+    Parameters:
+    file_name (str): The name of the CSV file to load.
+
+    Returns:
+    Tuple[np.ndarray, np.ndarray]: Arrays of dates (datetime64[D]) and corresponding weights (float64), empty if no valid data was found.
+    """
+    no_data = np.array([], dtype='datetime64[D]'), np.array([], dtype=np.float64)
+
     # Allow full or relative paths; if a path separator is present, use the provided path directly
     if os.path.sep in file_name or os.path.isabs(file_name):
         file_path = file_name
@@ -43,29 +124,120 @@ def load_data(file_name: str) -> Tuple[List[datetime], List[float]]:
         file_path = f"{DATA_DIRECTORY}/{file_name}"
 
     try:
-        with open(file_path, 'r') as f:
-            reader = csv.reader(f)
-            for row in reader:
-                if len(row) == 2:
-                    date_str, weight_str = row
-                    try:
-                        date = datetime.strptime(date_str, '%Y-%m-%d')
-                        weight = float(weight_str)
-                        dates.append(date)
-                        weights.append(weight)
-                    except ValueError as e:
-                        logging.warning(f"Skipping invalid row {row}: {e}")
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore', UserWarning)  # empty file, reported below
+                # One character wider than YYYY-MM-DD, so that longer strings are not silently truncated
+                data = np.loadtxt(file_path, delimiter=',', comments=None, ndmin=1,
+                                  dtype=[('date', 'U11'), ('weight', 'f8')])
+            date_strings = data['date']
+            dates, weights = date_strings.astype('datetime64[D]'), data['weight']
+            # NumPy also accepts partial dates ('2024-01'), signs, times and 'NaT'. Only keep the result
+            # if every date is valid and exactly in YYYY-MM-DD format, otherwise parse row by row.
+            if np.isnat(dates).any() or not (dates.astype('U11') == date_strings).all():
+                raise ValueError("non-standard dates")
+        except ValueError:
+            date_list, weight_list = _load_data_rows(file_path)
+            dates = np.array(date_list, dtype='datetime64[D]')
+            weights = np.array(weight_list, dtype=np.float64)
     except FileNotFoundError:
         logging.error(f"Error: File '{file_path}' not found. Ensure the file exists in the 'data/' directory.")
-        return [], []
+        return no_data
 
-    if not dates:
+    if dates.size == 0:
         logging.warning("No valid data found in the file. Please check the file format and contents.")
-        return [], []
+        return no_data
 
     return dates, weights
 
-def load_fenton_data(due_date: datetime) -> Dict[str, Tuple[List[datetime], List[float]]]:
+def _fenton_transform(gestational_age_weeks: np.ndarray, weights_kg: np.ndarray, due_date64: np.datetime64) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Convert Fenton gestational ages and weights into dates and weights in grams.
+
+    Parameters:
+    gestational_age_weeks (np.ndarray): Gestational ages in weeks.
+    weights_kg (np.ndarray): Corresponding weights in kilograms.
+    due_date64 (np.datetime64): The expected due date, corresponding to 40 weeks.
+
+    Returns:
+    Tuple[np.ndarray, np.ndarray]: Arrays of dates (datetime64) and weights in grams.
+    """
+    # Offset from the due date in seconds, keeping the sub-day resolution of the data
+    offsets = np.rint((gestational_age_weeks - 40.)*(7*24*3600)).astype('timedelta64[s]')
+    return due_date64 + offsets, 1000.*weights_kg
+
+def _load_fenton_csv(file_path: str) -> Optional[np.ndarray]:
+    """
+    Load a single Fenton percentile CSV file.
+
+    Parameters:
+    file_path (str): The path of the CSV file to load.
+
+    Returns:
+    Optional[np.ndarray]: Array with columns gestational age (weeks) and weight (kg), or None if the file could not be loaded.
+    """
+    try:
+        return np.loadtxt(file_path, delimiter=',', ndmin=2)
+    except FileNotFoundError:
+        logging.error(f"Error: File '{file_path}' not found. Ensure the file exists in the '{FENTON_DIRECTORY}/' directory.")
+    except ValueError as e:
+        logging.warning(f"Skipping invalid file {file_path}: {e}")
+    return None
+
+def _load_fenton_arrays() -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+    """
+    Load the raw Fenton growth data, using a preparsed .npz cache when it is up to date.
+
+    The cache is rebuilt from the CSV files whenever one of them is newer than the cache.
+
+    Returns:
+    Dict[str, Tuple[np.ndarray, np.ndarray]]: Dictionary mapping percentile to arrays of gestational ages (weeks, sorted) and weights (kg).
+    """
+    file_paths = [f"{FENTON_DIRECTORY}/{percentile}.csv" for percentile in PERCENTILES]
+
+    try:
+        cache_mtime = os.path.getmtime(FENTON_CACHE_FILE)
+        if all(os.path.getmtime(file_path) <= cache_mtime for file_path in file_paths):
+            with np.load(FENTON_CACHE_FILE) as cache:
+                return {percentile: (cache[f'{percentile}_ga'], cache[f'{percentile}_w']) for percentile in PERCENTILES}
+    except Exception:
+        # Missing or unreadable cache, e.g. a truncated file (zipfile.BadZipFile, EOFError, zlib.error):
+        # rebuild it below
+        pass
+
+    # Read the files concurrently, the work is mostly file I/O and NumPy parsing
+    with ThreadPoolExecutor(max_workers=len(file_paths)) as executor:
+        loaded = list(executor.map(_load_fenton_csv, file_paths))
+
+    fenton_arrays: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+    for percentile, data in zip(PERCENTILES, loaded):
+        if data is not None:
+            data = data[np.argsort(data[:, 0], kind='stable')]  # plot_data relies on sorted gestational ages
+            fenton_arrays[percentile] = (data[:, 0], data[:, 1])
+
+    # Only cache complete data, so that missing files keep being reported
+    if len(fenton_arrays) == len(PERCENTILES):
+        arrays = {}
+        for percentile, (gestational_age_weeks, weights_kg) in fenton_arrays.items():
+            arrays[f'{percentile}_ga'] = gestational_age_weeks
+            arrays[f'{percentile}_w'] = weights_kg
+        # Write to a temporary file and move it into place, so that an interrupted or concurrent
+        # write never leaves a damaged cache behind
+        tmp_path = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=FENTON_DIRECTORY, prefix='_cache.', suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                np.savez_compressed(f, **arrays)
+            os.chmod(tmp_path, 0o644)  # mkstemp creates the file readable by the owner only
+            os.replace(tmp_path, FENTON_CACHE_FILE)
+        except OSError as e:
+            logging.warning(f"Could not write Fenton cache '{FENTON_CACHE_FILE}': {e}")
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    return fenton_arrays
+
+def load_fenton_data(due_date: datetime) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
     """
     Load Fenton growth data from CSV files and convert gestational ages to actual dates.
 
@@ -73,81 +245,93 @@ def load_fenton_data(due_date: datetime) -> Dict[str, Tuple[List[datetime], List
     due_date (datetime): The expected due date.
 
     Returns:
-    Dict[str, Tuple[List[datetime], List[float]]]: Dictionary mapping percentile to list of (date, weight) tuples.
+    Dict[str, Tuple[np.ndarray, np.ndarray]]: Dictionary mapping percentile to arrays of dates (datetime64) and weights.
     """
-    fenton_data: Dict[str, Tuple[List[datetime], List[float]]] = {}
+    due_date64 = np.datetime64(due_date, 's')
+    return {percentile: _fenton_transform(gestational_age_weeks, weights_kg, due_date64)
+            for percentile, (gestational_age_weeks, weights_kg) in _load_fenton_arrays().items()}
 
-    for percentile in ['3%', '10%', '50%', '90%', '97%']:
-        file_path = f"{FENTON_DIRECTORY}/{percentile}.csv"
-        try:
-            with open(file_path, 'r') as f:
-                reader = csv.reader(f)
-                fenton_data[percentile] = ([], [])
-                for row in reader:
-                    if len(row) == 2:
-                        try:
-                            gestational_age_weeks = float(row[0])
-                            weight = 1000.*float(row[1]) # convert to grams
-                            date = due_date - timedelta(weeks=(40 - gestational_age_weeks))
-                            fenton_data[percentile][0].append(date)
-                            fenton_data[percentile][1].append(weight)
-                        except ValueError as e:
-                            logging.warning(f"Skipping invalid row {row} in {file_path}: {e}")
-        except FileNotFoundError:
-            logging.error(f"Error: File '{file_path}' not found. Ensure the file exists in the 'fenton_boys/' directory.")
-
-    return fenton_data
-
-def plot_data(baby_dates: List[datetime], baby_weights: List[float], fenton_growth_data: Dict[str, Tuple[List[datetime], List[float]]]) -> matplotlib.figure.Figure:
+def compute_limits(values, margin_percent=0.05):
+    """
+    Compute the limits for a plot axis with a specified margin percentage.
+
+    Parameters:
+    values (np.ndarray or Sequence): Array or sequence of values (numbers, datetime or datetime64) for the axis.
+    margin_percent (float): Percentage of value range to add/subtract from the min/max values as margin (default: 0.05).
+
+    Returns:
+    Tuple: Tuple of (min_limit, max_limit) according to the specified margin.
+
+    Raises:
+    ValueError: If values is empty.
+    """
+    if isinstance(values, np.ndarray):
+        if values.dtype.kind == 'M':
+            values = values.astype('datetime64[s]')  # so that the margin is not truncated to whole days
+        min_value = values.min()
+        max_value = values.max()
+    else:
+        # Track both extrema in a single pass instead of separate min() and max() calls
+        iterator = iter(values)
+        min_value = max_value = next(iterator, None)
+        if min_value is None:
+            raise ValueError("compute_limits() arg is an empty sequence")
+        for value in iterator:
+            if value < min_value:
+                min_value = value
+            elif value > max_value:
+                max_value = value
+    margin = (max_value - min_value) * margin_percent
+    return min_value - margin, max_value + margin
+
+def plot_data(baby_dates: np.ndarray, baby_weights: np.ndarray, fenton_growth_data: Dict[str, Tuple[np.ndarray, np.ndarray]], ax: Optional[matplotlib.axes.Axes] = None) -> matplotlib.figure.Figure:
     """
     Plot the weight data against dates.
 
     Parameters:
-    baby_dates (List[datetime]): List of dates for the baby's weight measurements.
-    baby_weights (List[float]): Corresponding list of weights for the baby.
-    fenton_growth_data (Dict[str, Tuple[List[datetime], List[float]]]): Fenton growth data for comparison.
+    baby_dates (np.ndarray): Array of dates (datetime64) for the baby's weight measurements.
+    baby_weights (np.ndarray): Corresponding array of weights for the baby.
+    fenton_growth_data (Dict[str, Tuple[np.ndarray, np.ndarray]]): Fenton growth data for comparison.
+    ax (Optional[matplotlib.axes.Axes]): Existing axes to clear and plot into, e.g. of an embedded figure; Fenton curves are then clipped to the visible range (default: new pyplot figure).
+
+    Returns:
+    matplotlib.figure.Figure: The figure containing the plot.
     """
-    def compute_limits(values, margin_percent=0.05):
-        """
-        Compute the limits for a plot axis with a specified margin percentage.
-    
-        Parameters:
-        values (List[float]): List of values for the axis.
-        margin_percent (float): Percentage of value range to add/subtract from the min/max values as margin (default: 0.05).
-    
-        Returns:
-        Tuple[float, float]: Tuple of (min_limit, max_limit) according to the specified margin.
-        """
-        range_value = max(values) - min(values)
-        margin = range_value * margin_percent
-        return min(values) - margin, max(values) + margin
-    
-    fig = plt.figure(figsize=(10, 5))
-    plt.plot(baby_dates, baby_weights, marker='o', linestyle='', color='b', label='Baby Weight')
-    
-    line_styles = {
-        '3%': ':',
-        '10%': '--',
-        '50%': '-',
-        '90%': '--',
-        '97%': ':'
-    }
+    # Curves are only clipped to the visible date range for existing (embedded) axes, which can't be
+    # panned or zoomed. The interactive pyplot window gets the full curves.
+    clip = ax is not None
+    if ax is None:
+        fig, ax = plt.subplots(figsize=(10, 5))
+    else:
+        ax.cla()
+        fig = ax.figure
+    ax.plot(baby_dates, baby_weights, marker='o', linestyle='', color='b', label='Baby Weight')
     
-    for percentile, data in fenton_growth_data.items():
-        plt.plot(data[0], data[1], linestyle=line_styles[percentile], label=f'{percentile} Percentile')
+    x_min, x_max = compute_limits(baby_dates, margin_percent=0.05)
+    for percentile in PERCENTILES:
+        if percentile not in fenton_growth_data:
+            continue
+        dates, weights = fenton_growth_data[percentile]
+        if clip:
+            # Only plot the part of the (date-sorted) curve inside the visible date range, plus one
+            # point on either side so that the line still reaches the edges of the plot
+            lo = max(np.searchsorted(dates, x_min) - 1, 0)
+            hi = np.searchsorted(dates, x_max, side='right') + 1
+            dates, weights = dates[lo:hi], weights[lo:hi]
+        ax.plot(dates, weights, linestyle=LINE_STYLES[percentile], label=f'{percentile} Percentile')
     
-    plt.xlim(*compute_limits(baby_dates, margin_percent=0.05))
-    plt.ylim(*compute_limits(baby_weights, margin_percent=0.10))
+    ax.set_xlim(x_min, x_max)
+    ax.set_ylim(*compute_limits(baby_weights, margin_percent=0.10))
     
-    plt.xlabel('Date')
-    plt.ylabel('Weight [g]')
-    plt.title('Weight Development')
-    plt.grid(True, linestyle='--')
-    plt.xticks(rotation=45)
-    plt.legend()
-    plt.tight_layout()
-    plt.tight_layout()
-    return plt.gcf()
+    ax.set_xlabel('Date')
+    ax.set_ylabel('Weight [g]')
+    ax.set_title('Weight Development')
+    ax.grid(True, linestyle='--')
+    ax.tick_params(axis='x', labelrotation=45)
+    ax.legend()
+    fig.tight_layout()
+    fig.tight_layout()
+    return fig
 
 def main() -> None:
     """
@@ -162,7 +346,7 @@ def main() -> None:
     baby_dates, baby_weights = load_data(args.file_name)
     fenton_growth_data = load_fenton_data(due_date)
 
-    if baby_dates:
+    if baby_dates.size:
         fig = plot_data(baby_dates, baby_weights, fenton_growth_data)
         plt.show()
 